@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 import sys
@@ -11,7 +12,7 @@ from alpaca.common.enums import SupportedCurrencies
 from alpaca.common.exceptions import APIError
 from alpaca.data.enums import DataFeed, OptionsFeed
 from alpaca.data.historical.option import OptionHistoricalDataClient
-from alpaca.data.historical.stock import StockHistoricalDataClient, StockLatestTradeRequest
+from alpaca.data.historical.stock import StockHistoricalDataClient
 from alpaca.data.live.stock import StockDataStream
 from alpaca.data.requests import (
     OptionLatestQuoteRequest,
@@ -22,8 +23,7 @@ from alpaca.data.requests import (
     StockLatestQuoteRequest,
     StockLatestTradeRequest,
     StockSnapshotRequest,
-    StockTradesRequest,
-    OptionChainRequest
+    StockTradesRequest
 )
 from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
 from alpaca.trading.client import TradingClient
@@ -35,7 +35,6 @@ from alpaca.trading.enums import (
     OrderClass,
     OrderSide,
     OrderType,
-    PositionIntent,
     QueryOrderStatus,
     TimeInForce,
 )
@@ -119,6 +118,9 @@ stock_data_stream_client = StockDataStream(TRADE_API_KEY, TRADE_API_SECRET, url_
 # For option historical data
 option_historical_data_client = OptionHistoricalDataClientSigned(api_key=TRADE_API_KEY, secret_key=TRADE_API_SECRET)
 
+# Separator line placed between records in list-style tool output
+_RECORD_SEPARATOR = "-" * 30
+
 # ============================================================================
 # Account Information Tools
 # ============================================================================
@@ -141,7 +143,7 @@ async def get_account_info() -> str:
             - Pattern Day Trader Status
             - Day Trades Remaining
     """
-    account = trade_client.get_account()
+    account = await asyncio.to_thread(trade_client.get_account)
     
     info = f"""
             Account Information:
@@ -174,14 +176,13 @@ async def get_positions() -> str:
             - Current Price
             - Unrealized P/L
     """
-    positions = trade_client.get_all_positions()
+    positions = await asyncio.to_thread(trade_client.get_all_positions)
     
     if not positions:
         return "No open positions found."
     
-    result = "Current Positions:\n-------------------\n"
-    for position in positions:
-        result += f"""
+    position_details = "".join(
+        f"""
                     Symbol: {position.symbol}
                     Quantity: {position.qty} shares
                     Market Value: ${float(position.market_value):.2f}
@@ -190,7 +191,9 @@ async def get_positions() -> str:
                     Unrealized P/L: ${float(position.unrealized_pl):.2f} ({float(position.unrealized_plpc) * 100:.2f}%)
                     -------------------
                     """
-    return result
+        for position in positions
+    )
+    return f"Current Positions:\n-------------------\n{position_details}"
 
 @mcp.tool()
 async def get_open_position(symbol: str) -> str:
@@ -204,7 +207,7 @@ async def get_open_position(symbol: str) -> str:
         str: Formatted string containing the position details or an error message
     """
     try:
-        position = trade_client.get_open_position(symbol)
+        position = await asyncio.to_thread(trade_client.get_open_position, symbol)
         
         # Check if it's an options position by looking for the options symbol pattern
         is_option = len(symbol) > 6 and any(c in symbol for c in ['C', 'P'])
@@ -246,7 +249,7 @@ async def get_stock_quote(symbol: str) -> str:
     """
     try:
         request_params = StockLatestQuoteRequest(symbol_or_symbols=symbol)
-        quotes = stock_historical_data_client.get_stock_latest_quote(request_params)
+        quotes = await asyncio.to_thread(stock_historical_data_client.get_stock_latest_quote, request_params)
         
         if symbol in quotes:
             quote = quotes[symbol]
@@ -299,6 +302,9 @@ async def get_stock_bars(
         if timeframe_obj is None:
             return f"Error: Invalid timeframe '{timeframe}'. Supported formats: 1Min, 2Min, 4Min, 5Min, 15Min, 30Min, 1Hour, 2Hour, 4Hour, 1Day, 1Week, 1Month, etc."
         
+        # Intraday timeframes drive both the lookback window and the bar timestamp format
+        is_intraday = timeframe_obj.unit_value in [TimeFrameUnit.Minute, TimeFrameUnit.Hour]
+        
         # Parse start/end times or calculate from days
         start_time = None
         end_time = None
@@ -316,20 +322,21 @@ async def get_stock_bars(
                 return f"Error: Invalid end time format '{end}'. Use ISO format like '2023-01-01T16:00:00' or '2023-01-01'"
         
         # If no start/end provided, calculate from days parameter OR limit+timeframe
+        now = datetime.now()
         if not start_time:
-            if limit and timeframe_obj.unit_value in [TimeFrameUnit.Minute, TimeFrameUnit.Hour]:
+            if limit and is_intraday:
                 # Calculate based on limit and timeframe for intraday data
                 if timeframe_obj.unit_value == TimeFrameUnit.Minute:
                     minutes_back = limit * timeframe_obj.amount
-                    start_time = datetime.now() - timedelta(minutes=minutes_back)
+                    start_time = now - timedelta(minutes=minutes_back)
                 elif timeframe_obj.unit_value == TimeFrameUnit.Hour:
                     hours_back = limit * timeframe_obj.amount
-                    start_time = datetime.now() - timedelta(hours=hours_back)
+                    start_time = now - timedelta(hours=hours_back)
             else:
                 # Fall back to days parameter for daily+ timeframes
-                start_time = datetime.now() - timedelta(days=days)
+                start_time = now - timedelta(days=days)
         if not end_time:
-            end_time = datetime.now()
+            end_time = now
         
         request_params = StockBarsRequest(
             symbol_or_symbols=symbol,
@@ -339,23 +346,25 @@ async def get_stock_bars(
             limit=limit
         )
         
-        bars = stock_historical_data_client.get_stock_bars(request_params)
+        bars = await asyncio.to_thread(stock_historical_data_client.get_stock_bars, request_params)
         
         if bars[symbol]:
             time_range = f"{start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}"
-            result = f"Historical Data for {symbol} ({timeframe} bars, {time_range}):\n"
-            result += "---------------------------------------------------\n"
+            response_parts = [
+                f"Historical Data for {symbol} ({timeframe} bars, {time_range}):\n",
+                "---------------------------------------------------\n",
+            ]
             
             for bar in bars[symbol]:
                 # Format timestamp based on timeframe unit
-                if timeframe_obj.unit_value in [TimeFrameUnit.Minute, TimeFrameUnit.Hour]:
+                if is_intraday:
                     time_str = bar.timestamp.strftime('%Y-%m-%d %H:%M:%S')
                 else:
                     time_str = bar.timestamp.date()
                 
-                result += f"Time: {time_str}, Open: ${bar.open:.2f}, High: ${bar.high:.2f}, Low: ${bar.low:.2f}, Close: ${bar.close:.2f}, Volume: {bar.volume}\n"
+                response_parts.append(f"Time: {time_str}, Open: ${bar.open:.2f}, High: ${bar.high:.2f}, Low: ${bar.low:.2f}, Close: ${bar.close:.2f}, Volume: {bar.volume}\n")
             
-            return result
+            return "".join(response_parts)
         else:
             return f"No historical data found for {symbol} with {timeframe} timeframe in the specified time range."
     except Exception as e:
@@ -388,13 +397,14 @@ async def get_stock_trades(
     """
     try:
         # Calculate start time based on days
-        start_time = datetime.now() - timedelta(days=days)
+        end_time = datetime.now()
+        start_time = end_time - timedelta(days=days)
         
         # Create the request object with all available parameters
         request_params = StockTradesRequest(
             symbol_or_symbols=symbol,
             start=start_time,
-            end=datetime.now(),
+            end=end_time,
             limit=limit,
             sort=sort,
             feed=feed,
@@ -403,14 +413,16 @@ async def get_stock_trades(
         )
         
         # Get the trades
-        trades = stock_historical_data_client.get_stock_trades(request_params)
+        trades = await asyncio.to_thread(stock_historical_data_client.get_stock_trades, request_params)
         
         if symbol in trades:
-            result = f"Historical Trades for {symbol} (Last {days} days):\n"
-            result += "---------------------------------------------------\n"
+            response_parts = [
+                f"Historical Trades for {symbol} (Last {days} days):\n",
+                "---------------------------------------------------\n",
+            ]
             
             for trade in trades[symbol]:
-                result += f"""
+                response_parts.append(f"""
                     Time: {trade.timestamp}
                     Price: ${float(trade.price):.6f}
                     Size: {trade.size}
@@ -418,8 +430,8 @@ async def get_stock_trades(
                     ID: {trade.id}
                     Conditions: {trade.conditions}
                     -------------------
-                    """
-            return result
+                    """)
+            return "".join(response_parts)
         else:
             return f"No trade data found for {symbol} in the last {days} days."
     except Exception as e:
@@ -450,7 +462,7 @@ async def get_stock_latest_trade(
         )
         
         # Get the latest trade
-        latest_trades = stock_historical_data_client.get_stock_latest_trade(request_params)
+        latest_trades = await asyncio.to_thread(stock_historical_data_client.get_stock_latest_trade, request_params)
         
         if symbol in latest_trades:
             trade = latest_trades[symbol]
@@ -494,7 +506,7 @@ async def get_stock_latest_bar(
         )
         
         # Get the latest bar
-        latest_bars = stock_historical_data_client.get_stock_latest_bar(request_params)
+        latest_bars = await asyncio.to_thread(stock_historical_data_client.get_stock_latest_bar, request_params)
         
         if symbol in latest_bars:
             bar = latest_bars[symbol]
@@ -563,6 +575,23 @@ def _format_trade_data(trade) -> str:
 
 """
 
+# Error template for data feeds that need a premium subscription; formatted with error_message
+_PREMIUM_DATA_FEED_ERROR_TEMPLATE = """
+                    Error: Premium data feed subscription required.
+
+                    The requested data feed requires a premium subscription. Available data feeds:
+
+                    • IEX (Default): Investor's Exchange data feed - Free with basic account
+                    • SIP: Securities Information Processor feed - Requires premium subscription
+                    • DELAYED_SIP: SIP data with 15-minute delay - Requires premium subscription  
+                    • OTC: Over the counter feed - Requires premium subscription
+
+                    Most users can access comprehensive market data using the default IEX feed.
+                    To use premium feeds (SIP, DELAYED_SIP, OTC), please upgrade your subscription.
+
+                    Original error: {error_message}
+                    """
+
 @mcp.tool()
 async def get_stock_snapshot(
     symbol_or_symbols: Union[str, List[str]], 
@@ -588,7 +617,7 @@ async def get_stock_snapshot(
     try:
         # Create and execute request
         request = StockSnapshotRequest(symbol_or_symbols=symbol_or_symbols, feed=feed, currency=currency)
-        snapshots = stock_historical_data_client.get_stock_snapshot(request)
+        snapshots = await asyncio.to_thread(stock_historical_data_client.get_stock_snapshot, request)
         
         # Format response
         symbols = [symbol_or_symbols] if isinstance(symbol_or_symbols, str) else symbol_or_symbols
@@ -617,23 +646,10 @@ async def get_stock_snapshot(
         
     except APIError as api_error:
         error_message = str(api_error)
+        lowered_message = error_message.lower()
         # Handle specific data feed subscription errors
-        if "subscription" in error_message.lower() and ("sip" in error_message.lower() or "premium" in error_message.lower()):
-            return f"""
-                    Error: Premium data feed subscription required.
-
-                    The requested data feed requires a premium subscription. Available data feeds:
-
-                    • IEX (Default): Investor's Exchange data feed - Free with basic account
-                    • SIP: Securities Information Processor feed - Requires premium subscription
-                    • DELAYED_SIP: SIP data with 15-minute delay - Requires premium subscription  
-                    • OTC: Over the counter feed - Requires premium subscription
-
-                    Most users can access comprehensive market data using the default IEX feed.
-                    To use premium feeds (SIP, DELAYED_SIP, OTC), please upgrade your subscription.
-
-                    Original error: {error_message}
-                    """
+        if "subscription" in lowered_message and ("sip" in lowered_message or "premium" in lowered_message):
+            return _PREMIUM_DATA_FEED_ERROR_TEMPLATE.format(error_message=error_message)
         else:
             return f"API Error retrieving stock snapshots: {error_message}"
             
@@ -644,6 +660,13 @@ async def get_stock_snapshot(
 # Order Management Tools
 # ============================================================================
 
+# Order status filters mapped to their QueryOrderStatus enums
+_ORDER_STATUS_MAPPING = {
+    'open': QueryOrderStatus.OPEN,
+    'closed': QueryOrderStatus.CLOSED,
+    'all': QueryOrderStatus.ALL
+}
+
 @mcp.tool()
 async def get_orders(status: str = "all", limit: int = 10) -> str:
     """
@@ -665,29 +688,26 @@ async def get_orders(status: str = "all", limit: int = 10) -> str:
             - Fill Details (if applicable)
     """
     try:
-        # Convert status string to enum
-        if status.lower() == "open":
-            query_status = QueryOrderStatus.OPEN
-        elif status.lower() == "closed":
-            query_status = QueryOrderStatus.CLOSED
-        else:
-            query_status = QueryOrderStatus.ALL
+        # Convert status string to enum, defaulting to all orders
+        query_status = _ORDER_STATUS_MAPPING.get(status.lower(), QueryOrderStatus.ALL)
             
         request_params = GetOrdersRequest(
             status=query_status,
             limit=limit
         )
         
-        orders = trade_client.get_orders(request_params)
+        orders = await asyncio.to_thread(trade_client.get_orders, request_params)
         
         if not orders:
             return f"No {status} orders found."
         
-        result = f"{status.capitalize()} Orders (Last {len(orders)}):\n"
-        result += "-----------------------------------\n"
+        result_parts = [
+            f"{status.capitalize()} Orders (Last {len(orders)}):\n",
+            "-----------------------------------\n"
+        ]
         
         for order in orders:
-            result += f"""
+            result_parts.append(f"""
                         Symbol: {order.symbol}
                         ID: {order.id}
                         Type: {order.type}
@@ -695,19 +715,29 @@ async def get_orders(status: str = "all", limit: int = 10) -> str:
                         Quantity: {order.qty}
                         Status: {order.status}
                         Submitted At: {order.submitted_at}
-                        """
+                        """)
             if hasattr(order, 'filled_at') and order.filled_at:
-                result += f"Filled At: {order.filled_at}\n"
+                result_parts.append(f"Filled At: {order.filled_at}\n")
                 
             if hasattr(order, 'filled_avg_price') and order.filled_avg_price:
-                result += f"Filled Price: ${float(order.filled_avg_price):.2f}\n"
+                result_parts.append(f"Filled Price: ${float(order.filled_avg_price):.2f}\n")
                 
-            result += "-----------------------------------\n"
+            result_parts.append("-----------------------------------\n")
             
-        return result
+        return "".join(result_parts)
     except Exception as e:
         return f"Error fetching orders: {str(e)}"
 
+# Valid equity time_in_force strings mapped to their TimeInForce enums
+_TIME_IN_FORCE_MAPPING = {
+    'DAY': TimeInForce.DAY,
+    'GTC': TimeInForce.GTC,
+    'OPG': TimeInForce.OPG,
+    'CLS': TimeInForce.CLS,
+    'IOC': TimeInForce.IOC,
+    'FOK': TimeInForce.FOK
+}
+
 @mcp.tool()
 async def place_stock_order(
     symbol: str,
@@ -757,95 +787,68 @@ async def place_stock_order(
             tif_enum = time_in_force
         elif isinstance(time_in_force, str):
             # Convert string to TimeInForce enum
-            time_in_force_upper = time_in_force.upper()
-            if time_in_force_upper == "DAY":
-                tif_enum = TimeInForce.DAY
-            elif time_in_force_upper == "GTC":
-                tif_enum = TimeInForce.GTC
-            elif time_in_force_upper == "OPG":
-                tif_enum = TimeInForce.OPG
-            elif time_in_force_upper == "CLS":
-                tif_enum = TimeInForce.CLS
-            elif time_in_force_upper == "IOC":
-                tif_enum = TimeInForce.IOC
-            elif time_in_force_upper == "FOK":
-                tif_enum = TimeInForce.FOK
-            else:
+            tif_enum = _TIME_IN_FORCE_MAPPING.get(time_in_force.upper())
+            if tif_enum is None:
                 return f"Invalid time_in_force: {time_in_force}. Valid options are: DAY, GTC, OPG, CLS, IOC, FOK"
         else:
             return f"Invalid time_in_force type: {type(time_in_force)}. Must be string or TimeInForce enum."
 
+        # Fields shared by every stock order request type
+        common_order_params = {
+            "symbol": symbol,
+            "qty": quantity,
+            "side": order_side,
+            "time_in_force": tif_enum,
+            "extended_hours": extended_hours,
+            "client_order_id": client_order_id or f"order_{int(time.time())}"
+        }
+
         # Validate order_type
         order_type_upper = order_type.upper()
         if order_type_upper == "MARKET":
             order_data = MarketOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=order_side,
                 type=OrderType.MARKET,
-                time_in_force=tif_enum,
-                extended_hours=extended_hours,
-                client_order_id=client_order_id or f"order_{int(time.time())}"
+                **common_order_params
             )
         elif order_type_upper == "LIMIT":
             if limit_price is None:
                 return "limit_price is required for LIMIT orders."
             order_data = LimitOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=order_side,
                 type=OrderType.LIMIT,
-                time_in_force=tif_enum,
                 limit_price=limit_price,
-                extended_hours=extended_hours,
-                client_order_id=client_order_id or f"order_{int(time.time())}"
+                **common_order_params
             )
         elif order_type_upper == "STOP":
             if stop_price is None:
                 return "stop_price is required for STOP orders."
             order_data = StopOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=order_side,
                 type=OrderType.STOP,
-                time_in_force=tif_enum,
                 stop_price=stop_price,
-                extended_hours=extended_hours,
-                client_order_id=client_order_id or f"order_{int(time.time())}"
+                **common_order_params
             )
         elif order_type_upper == "STOP_LIMIT":
             if stop_price is None or limit_price is None:
                 return "Both stop_price and limit_price are required for STOP_LIMIT orders."
             order_data = StopLimitOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=order_side,
                 type=OrderType.STOP_LIMIT,
-                time_in_force=tif_enum,
                 stop_price=stop_price,
                 limit_price=limit_price,
-                extended_hours=extended_hours,
-                client_order_id=client_order_id or f"order_{int(time.time())}"
+                **common_order_params
             )
         elif order_type_upper == "TRAILING_STOP":
             if trail_price is None and trail_percent is None:
                 return "Either trail_price or trail_percent is required for TRAILING_STOP orders."
             order_data = TrailingStopOrderRequest(
-                symbol=symbol,
-                qty=quantity,
-                side=order_side,
                 type=OrderType.TRAILING_STOP,
-                time_in_force=tif_enum,
                 trail_price=trail_price,
                 trail_percent=trail_percent,
-                extended_hours=extended_hours,
-                client_order_id=client_order_id or f"order_{int(time.time())}"
+                **common_order_params
             )
         else:
             return f"Invalid order type: {order_type}. Must be one of: MARKET, LIMIT, STOP, STOP_LIMIT, TRAILING_STOP."
 
         # Submit order
-        order = trade_client.submit_order(order_data)
+        order = await asyncio.to_thread(trade_client.submit_order, order_data)
         return f"""
 Order Placed Successfully:
 -------------------------
@@ -871,14 +874,14 @@ async def cancel_all_orders() -> str:
     """
     try:
         # Cancel all orders
-        cancel_responses = trade_client.cancel_orders()
+        cancel_responses = await asyncio.to_thread(trade_client.cancel_orders)
         
         if not cancel_responses:
             return "No orders were found to cancel."
         
         # Format the response
         response_parts = ["Order Cancellation Results:"]
-        response_parts.append("-" * 30)
+        response_parts.append(_RECORD_SEPARATOR)
         
         for response in cancel_responses:
             status = "Success" if response.status == 200 else "Failed"
@@ -886,7 +889,7 @@ async def cancel_all_orders() -> str:
             response_parts.append(f"Status: {status}")
             if response.body:
                 response_parts.append(f"Details: {response.body}")
-            response_parts.append("-" * 30)
+            response_parts.append(_RECORD_SEPARATOR)
         
         return "\n".join(response_parts)
         
@@ -906,7 +909,7 @@ async def cancel_order_by_id(order_id: str) -> str:
     """
     try:
         # Cancel the specific order
-        response = trade_client.cancel_order_by_id(order_id)
+        response = await asyncio.to_thread(trade_client.cancel_order_by_id, order_id)
         
         # Format the response
         status = "Success" if response.status == 200 else "Failed"
@@ -929,6 +932,17 @@ async def cancel_order_by_id(order_id: str) -> str:
 # Position Management Tools
 # ============================================================================
 
+# Error message for partial closes that would round down to zero shares
+_POSITION_CLOSE_SIZE_ZERO_ERROR_MESSAGE = """
+            Error: Invalid position closure request.
+            
+            The requested percentage would result in less than 1 share.
+            Please either:
+            1. Use a higher percentage
+            2. Close the entire position (100%)
+            3. Specify an exact quantity using the qty parameter
+            """
+
 @mcp.tool()
 async def close_position(symbol: str, qty: Optional[str] = None, percentage: Optional[str] = None) -> str:
     """
@@ -952,7 +966,7 @@ async def close_position(symbol: str, qty: Optional[str] = None, percentage: Opt
             )
         
         # Close the position
-        order = trade_client.close_position(symbol, close_options)
+        order = await asyncio.to_thread(trade_client.close_position, symbol, close_options)
         
         return f"""
                 Position Closed Successfully:
@@ -965,15 +979,7 @@ async def close_position(symbol: str, qty: Optional[str] = None, percentage: Opt
     except APIError as api_error:
         error_message = str(api_error)
         if "42210000" in error_message and "would result in order size of zero" in error_message:
-            return """
-            Error: Invalid position closure request.
-            
-            The requested percentage would result in less than 1 share.
-            Please either:
-            1. Use a higher percentage
-            2. Close the entire position (100%)
-            3. Specify an exact quantity using the qty parameter
-            """
+            return _POSITION_CLOSE_SIZE_ZERO_ERROR_MESSAGE
         else:
             return f"Error closing position: {error_message}"
             
@@ -993,21 +999,21 @@ async def close_all_positions(cancel_orders: bool = False) -> str:
     """
     try:
         # Close all positions
-        close_responses = trade_client.close_all_positions(cancel_orders=cancel_orders)
+        close_responses = await asyncio.to_thread(trade_client.close_all_positions, cancel_orders=cancel_orders)
         
         if not close_responses:
             return "No positions were found to close."
         
         # Format the response
         response_parts = ["Position Closure Results:"]
-        response_parts.append("-" * 30)
+        response_parts.append(_RECORD_SEPARATOR)
         
         for response in close_responses:
             response_parts.append(f"Symbol: {response.symbol}")
             response_parts.append(f"Status: {response.status}")
             if response.order_id:
                 response_parts.append(f"Order ID: {response.order_id}")
-            response_parts.append("-" * 30)
+            response_parts.append(_RECORD_SEPARATOR)
         
         return "\n".join(response_parts)
         
@@ -1035,7 +1041,7 @@ async def get_asset_info(symbol: str) -> str:
             - Trading Properties
     """
     try:
-        asset = trade_client.get_asset(symbol)
+        asset = await asyncio.to_thread(trade_client.get_asset, symbol)
         return f"""
                 Asset Information for {symbol}:
                 ----------------------------
@@ -1080,14 +1086,14 @@ async def get_all_assets(
             )
         
         # Get all assets
-        assets = trade_client.get_all_assets(filter_params)
+        assets = await asyncio.to_thread(trade_client.get_all_assets, filter_params)
         
         if not assets:
             return "No assets found matching the criteria."
         
         # Format the response
         response_parts = ["Available Assets:"]
-        response_parts.append("-" * 30)
+        response_parts.append(_RECORD_SEPARATOR)
         
         for asset in assets:
             response_parts.append(f"Symbol: {asset.symbol}")
@@ -1096,7 +1102,7 @@ async def get_all_assets(
             response_parts.append(f"Class: {asset.asset_class}")
             response_parts.append(f"Status: {asset.status}")
             response_parts.append(f"Tradable: {'Yes' if asset.tradable else 'No'}")
-            response_parts.append("-" * 30)
+            response_parts.append(_RECORD_SEPARATOR)
         
         return "\n".join(response_parts)
         
@@ -1121,7 +1127,7 @@ async def create_watchlist(name: str, symbols: List[str]) -> str:
     """
     try:
         watchlist_data = CreateWatchlistRequest(name=name, symbols=symbols)
-        watchlist = trade_client.create_watchlist(watchlist_data)
+        watchlist = await asyncio.to_thread(trade_client.create_watchlist, watchlist_data)
         return f"Watchlist '{name}' created successfully with {len(symbols)} symbols."
     except Exception as e:
         return f"Error creating watchlist: {str(e)}"
@@ -1130,16 +1136,17 @@ async def create_watchlist(name: str, symbols: List[str]) -> str:
 async def get_watchlists() -> str:
     """Get all watchlists for the account."""
     try:
-        watchlists = trade_client.get_watchlists()
-        result = "Watchlists:\n------------\n"
-        for wl in watchlists:
-            result += f"Name: {wl.name}\n"
-            result += f"ID: {wl.id}\n"
-            result += f"Created: {wl.created_at}\n"
-            result += f"Updated: {wl.updated_at}\n"
-            # Use wl.symbols, fallback to empty list if missing
-            result += f"Symbols: {', '.join(getattr(wl, 'symbols', []) or [])}\n\n"
-        return result
+        watchlists = await asyncio.to_thread(trade_client.get_watchlists)
+        # Use wl.symbols, fallback to empty list if missing
+        watchlist_details = "".join(
+            f"Name: {wl.name}\n"
+            f"ID: {wl.id}\n"
+            f"Created: {wl.created_at}\n"
+            f"Updated: {wl.updated_at}\n"
+            f"Symbols: {', '.join(getattr(wl, 'symbols', []) or [])}\n\n"
+            for wl in watchlists
+        )
+        return "Watchlists:\n------------\n" + watchlist_details
     except Exception as e:
         return f"Error fetching watchlists: {str(e)}"
 
@@ -1148,7 +1155,7 @@ async def update_watchlist(watchlist_id: str, name: str = None, symbols: List[st
     """Update an existing watchlist."""
     try:
         update_request = UpdateWatchlistRequest(name=name, symbols=symbols)
-        watchlist = trade_client.update_watchlist_by_id(watchlist_id, update_request)
+        watchlist = await asyncio.to_thread(trade_client.update_watchlist_by_id, watchlist_id, update_request)
         return f"Watchlist updated successfully: {watchlist.name}"
     except Exception as e:
         return f"Error updating watchlist: {str(e)}"
@@ -1170,7 +1177,7 @@ async def get_market_clock() -> str:
             - Next Close Time
     """
     try:
-        clock = trade_client.get_clock()
+        clock = await asyncio.to_thread(trade_client.get_clock)
         return f"""
                 Market Status:
                 -------------
@@ -1182,6 +1189,11 @@ async def get_market_clock() -> str:
     except Exception as e:
         return f"Error fetching market clock: {str(e)}"
 
+# Trading calendars almost never change, so formatted results are cached per date range
+_MARKET_CALENDAR_CACHE_TTL = 3600  # seconds
+_MARKET_CALENDAR_CACHE_MAX_ENTRIES = 128
+_market_calendar_cache: Dict[tuple, tuple] = {}
+
 @mcp.tool()
 async def get_market_calendar(start_date: str, end_date: str) -> str:
     """
@@ -1194,11 +1206,24 @@ async def get_market_calendar(start_date: str, end_date: str) -> str:
     Returns:
         str: Formatted string containing market calendar information
     """
+    cache_key = (start_date, end_date)
+    cached = _market_calendar_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
     try:
-        calendar = trade_client.get_calendar(start=start_date, end=end_date)
-        result = f"Market Calendar ({start_date} to {end_date}):\n----------------------------\n"
-        for day in calendar:
-            result += f"Date: {day.date}, Open: {day.open}, Close: {day.close}\n"
+        calendar_request = GetCalendarRequest(start=start_date, end=end_date)
+        calendar = await asyncio.to_thread(trade_client.get_calendar, calendar_request)
+        result = f"Market Calendar ({start_date} to {end_date}):\n----------------------------\n" + "".join(
+            f"Date: {day.date}, Open: {day.open}, Close: {day.close}\n" for day in calendar
+        )
+        now = time.monotonic()
+        # Drop expired entries, then the oldest ones, so arbitrary date ranges can't grow the cache unbounded
+        for key in [key for key, (expires_at, _) in _market_calendar_cache.items() if expires_at <= now]:
+            del _market_calendar_cache[key]
+        while len(_market_calendar_cache) >= _MARKET_CALENDAR_CACHE_MAX_ENTRIES:
+            del _market_calendar_cache[next(iter(_market_calendar_cache))]
+        _market_calendar_cache[cache_key] = (now + _MARKET_CALENDAR_CACHE_TTL, result)
         return result
     except Exception as e:
         return f"Error fetching market calendar: {str(e)}"
@@ -1239,10 +1264,9 @@ async def get_corporate_announcements(
             cusip=cusip,
             date_type=date_type
         )
-        announcements = trade_client.get_corporate_announcements(request)
-        result = "Corporate Announcements:\n----------------------\n"
-        for ann in announcements:
-            result += f"""
+        announcements = await asyncio.to_thread(trade_client.get_corporate_announcements, request)
+        announcement_details = "".join(
+            f"""
                         ID: {ann.id}
                         Corporate Action ID: {ann.corporate_action_id}
                         Type: {ann.ca_type}
@@ -1258,7 +1282,9 @@ async def get_corporate_announcements(
                         New Rate: {ann.new_rate}
                         ----------------------
                         """
-        return result
+            for ann in announcements
+        )
+        return f"Corporate Announcements:\n----------------------\n{announcement_details}"
     except Exception as e:
         return f"Error fetching corporate announcements: {str(e)}"
 
@@ -1320,17 +1346,14 @@ async def get_option_contracts(
         )
         
         # Get the option contracts
-        response = trade_client.get_option_contracts(request)
+        response = await asyncio.to_thread(trade_client.get_option_contracts, request)
         
         if not response or not response.option_contracts:
             return f"No option contracts found for {underlying_symbol} matching the criteria."
         
         # Format the response
-        result = f"Option Contracts for {underlying_symbol}:\n"
-        result += "----------------------------------------\n"
-        
-        for contract in response.option_contracts:
-            result += f"""
+        contract_details = "".join(
+            f"""
                 Symbol: {contract.symbol}
                 Name: {contract.name}
                 Type: {contract.type}
@@ -1347,8 +1370,10 @@ async def get_option_contracts(
                 Close Price Date: {contract.close_price_date}
                 -------------------------
                 """
+            for contract in response.option_contracts
+        )
         
-        return result
+        return f"Option Contracts for {underlying_symbol}:\n----------------------------------------\n{contract_details}"
         
     except Exception as e:
         return f"Error fetching option contracts: {str(e)}"
@@ -1388,7 +1413,7 @@ async def get_option_latest_quote(
         )
         
         # Get the latest quote
-        quotes = option_historical_data_client.get_option_latest_quote(request)
+        quotes = await asyncio.to_thread(option_historical_data_client.get_option_latest_quote, request)
         
         if symbol in quotes:
             quote = quotes[symbol]
@@ -1454,11 +1479,10 @@ async def get_option_snapshot(symbol_or_symbols: Union[str, List[str]], feed: Op
         )
         
         # Get snapshots
-        snapshots = option_historical_data_client.get_option_snapshot(request)
+        snapshots = await asyncio.to_thread(option_historical_data_client.get_option_snapshot, request)
         
         # Format the response
-        result = "Option Snapshots:\n"
-        result += "================\n\n"
+        results = ["Option Snapshots:", "================", ""]
         
         # Handle both single symbol and list of symbols
         symbols = [symbol_or_symbols] if isinstance(symbol_or_symbols, str) else symbol_or_symbols
@@ -1466,61 +1490,67 @@ async def get_option_snapshot(symbol_or_symbols: Union[str, List[str]], feed: Op
         for symbol in symbols:
             snapshot = snapshots.get(symbol)
             if snapshot is None:
-                result += f"No data available for {symbol}\n"
+                results.append(f"No data available for {symbol}")
                 continue
                 
-            result += f"Symbol: {symbol}\n"
-            result += "-----------------\n"
+            results.extend([f"Symbol: {symbol}", "-----------------"])
             
             # Latest Quote
             if snapshot.latest_quote:
                 quote = snapshot.latest_quote
-                result += f"Latest Quote:\n"
-                result += f"  Bid Price: ${quote.bid_price:.6f}\n"
-                result += f"  Bid Size: {quote.bid_size}\n"
-                result += f"  Bid Exchange: {quote.bid_exchange}\n"
-                result += f"  Ask Price: ${quote.ask_price:.6f}\n"
-                result += f"  Ask Size: {quote.ask_size}\n"
-                result += f"  Ask Exchange: {quote.ask_exchange}\n"
+                results.extend([
+                    "Latest Quote:",
+                    f"  Bid Price: ${quote.bid_price:.6f}",
+                    f"  Bid Size: {quote.bid_size}",
+                    f"  Bid Exchange: {quote.bid_exchange}",
+                    f"  Ask Price: ${quote.ask_price:.6f}",
+                    f"  Ask Size: {quote.ask_size}",
+                    f"  Ask Exchange: {quote.ask_exchange}",
+                ])
                 if quote.conditions:
-                    result += f"  Conditions: {quote.conditions}\n"
+                    results.append(f"  Conditions: {quote.conditions}")
                 if quote.tape:
-                    result += f"  Tape: {quote.tape}\n"
-                result += f"  Timestamp: {quote.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f %Z')}\n"
+                    results.append(f"  Tape: {quote.tape}")
+                results.append(f"  Timestamp: {quote.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f %Z')}")
             
             # Latest Trade
             if snapshot.latest_trade:
                 trade = snapshot.latest_trade
-                result += f"Latest Trade:\n"
-                result += f"  Price: ${trade.price:.6f}\n"
-                result += f"  Size: {trade.size}\n"
+                results.extend([
+                    "Latest Trade:",
+                    f"  Price: ${trade.price:.6f}",
+                    f"  Size: {trade.size}",
+                ])
                 if trade.exchange:
-                    result += f"  Exchange: {trade.exchange}\n"
+                    results.append(f"  Exchange: {trade.exchange}")
                 if trade.conditions:
-                    result += f"  Conditions: {trade.conditions}\n"
+                    results.append(f"  Conditions: {trade.conditions}")
                 if trade.tape:
-                    result += f"  Tape: {trade.tape}\n"
+                    results.append(f"  Tape: {trade.tape}")
                 if trade.id:
-                    result += f"  Trade ID: {trade.id}\n"
-                result += f"  Timestamp: {trade.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f %Z')}\n"
+                    results.append(f"  Trade ID: {trade.id}")
+                results.append(f"  Timestamp: {trade.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f %Z')}")
             
             # Implied Volatility
             if snapshot.implied_volatility is not None:
-                result += f"Implied Volatility: {snapshot.implied_volatility:.2%}\n"
+                results.append(f"Implied Volatility: {snapshot.implied_volatility:.2%}")
             
             # Greeks
             if snapshot.greeks:
                 greeks = snapshot.greeks
-                result += f"Greeks:\n"
-                result += f"  Delta: {greeks.delta:.4f}\n"
-                result += f"  Gamma: {greeks.gamma:.4f}\n"
-                result += f"  Rho: {greeks.rho:.4f}\n"
-                result += f"  Theta: {greeks.theta:.4f}\n"
-                result += f"  Vega: {greeks.vega:.4f}\n"
+                results.extend([
+                    "Greeks:",
+                    f"  Delta: {greeks.delta:.4f}",
+                    f"  Gamma: {greeks.gamma:.4f}",
+                    f"  Rho: {greeks.rho:.4f}",
+                    f"  Theta: {greeks.theta:.4f}",
+                    f"  Vega: {greeks.vega:.4f}",
+                ])
             
-            result += "\n"
+            results.append("")
         
-        return result
+        # Every line, including the last, is newline-terminated
+        return "\n".join(results) + "\n"
         
     except Exception as e:
         return f"Error retrieving option snapshots: {str(e)}"
@@ -1683,9 +1713,8 @@ def _analyze_option_strategy_type(order_legs: List[OptionLegRequest], order_clas
     
     return is_short_straddle, is_short_strangle, is_short_calendar
 
-def _get_short_straddle_error_message() -> str:
-    """Get error message for short straddle permission issues."""
-    return """
+# Error message for short straddle permission issues
+_SHORT_STRADDLE_ERROR_MESSAGE = """
     Error: Account not eligible to trade short straddles.
     
     This error occurs because short straddles require Level 4 options trading permission.
@@ -1704,9 +1733,8 @@ def _get_short_straddle_error_message() -> str:
     - Implement a covered call or cash-secured put
     """
 
-def _get_short_strangle_error_message() -> str:
-    """Get error message for short strangle permission issues."""
-    return """
+# Error message for short strangle permission issues
+_SHORT_STRANGLE_ERROR_MESSAGE = """
     Error: Account not eligible to trade short strangles.
     
     This error occurs because short strangles require Level 4 options trading permission.
@@ -1725,9 +1753,8 @@ def _get_short_strangle_error_message() -> str:
     - Implement a covered call or cash-secured put
     """
 
-def _get_short_calendar_error_message() -> str:
-    """Get error message for short calendar spread permission issues."""
-    return """
+# Error message for short calendar spread permission issues
+_SHORT_CALENDAR_ERROR_MESSAGE = """
     Error: Account not eligible to trade short calendar spreads.
     
     This error occurs because short calendar spreads require Level 4 options trading permission.
@@ -1746,9 +1773,8 @@ def _get_short_calendar_error_message() -> str:
     - Implement a covered call or cash-secured put
     """
 
-def _get_uncovered_options_error_message() -> str:
-    """Get error message for uncovered options permission issues."""
-    return """
+# Error message for uncovered options permission issues
+_UNCOVERED_OPTIONS_ERROR_MESSAGE = """
     Error: Account not eligible to trade uncovered option contracts.
     
     This error occurs when attempting to place an order that could result in an uncovered position.
@@ -1767,21 +1793,8 @@ def _get_uncovered_options_error_message() -> str:
     - Ensure all positions are properly hedged
     """
 
-def _handle_option_api_error(error_message: str, order_legs: List[OptionLegRequest], order_class: OrderClass) -> str:
-    """Handle API errors with specific option strategy analysis."""
-    if "40310000" in error_message and "not eligible to trade uncovered option contracts" in error_message:
-        is_short_straddle, is_short_strangle, is_short_calendar = _analyze_option_strategy_type(order_legs, order_class)
-        
-        if is_short_straddle:
-            return _get_short_straddle_error_message()
-        elif is_short_strangle:
-            return _get_short_strangle_error_message()
-        elif is_short_calendar:
-            return _get_short_calendar_error_message()
-        else:
-            return _get_uncovered_options_error_message()
-    elif "403" in error_message:
-        return f"""
+# Error template for option permission denials; formatted with error_message
+_OPTION_PERMISSION_DENIED_ERROR_TEMPLATE = """
         Error: Permission denied for option trading.
         
         Possible reasons:
@@ -1796,8 +1809,9 @@ def _handle_option_api_error(error_message: str, order_legs: List[OptionLegReque
         
         Original error: {error_message}
         """
-    else:
-        return f"""
+
+# Error template for other option order API failures; formatted with error_message
+_OPTION_ORDER_ERROR_TEMPLATE = """
         Error placing option order: {error_message}
         
         Please check:
@@ -1807,6 +1821,35 @@ def _handle_option_api_error(error_message: str, order_legs: List[OptionLegReque
         4. Your account has the required permissions
         """
 
+# Error template for unexpected option order failures; formatted with error_message
+_UNEXPECTED_OPTION_ORDER_ERROR_TEMPLATE = """
+        Unexpected error placing option order: {error_message}
+        
+        Please try:
+        1. Verifying all input parameters
+        2. Checking your account status
+        3. Ensuring market is open
+        4. Contacting support if the issue persists
+        """
+
+def _handle_option_api_error(error_message: str, order_legs: List[OptionLegRequest], order_class: OrderClass) -> str:
+    """Handle API errors with specific option strategy analysis."""
+    if "40310000" in error_message and "not eligible to trade uncovered option contracts" in error_message:
+        is_short_straddle, is_short_strangle, is_short_calendar = _analyze_option_strategy_type(order_legs, order_class)
+        
+        if is_short_straddle:
+            return _SHORT_STRADDLE_ERROR_MESSAGE
+        elif is_short_strangle:
+            return _SHORT_STRANGLE_ERROR_MESSAGE
+        elif is_short_calendar:
+            return _SHORT_CALENDAR_ERROR_MESSAGE
+        else:
+            return _UNCOVERED_OPTIONS_ERROR_MESSAGE
+    elif "403" in error_message:
+        return _OPTION_PERMISSION_DENIED_ERROR_TEMPLATE.format(error_message=error_message)
+    else:
+        return _OPTION_ORDER_ERROR_TEMPLATE.format(error_message=error_message)
+
 # ============================================================================
 # Options Trading Tool
 # ============================================================================
@@ -1896,7 +1939,7 @@ async def place_option_market_order(
         )
         
         # Submit order
-        order = trade_client.submit_order(order_data)
+        order = await asyncio.to_thread(trade_client.submit_order, order_data)
         
         # Format and return response
         return _format_option_order_response(order, order_class, order_legs)
@@ -1905,15 +1948,27 @@ async def place_option_market_order(
         return _handle_option_api_error(str(api_error), order_legs, order_class)
         
     except Exception as e:
-        return f"""
-        Unexpected error placing option order: {str(e)}
-        
-        Please try:
-        1. Verifying all input parameters
-        2. Checking your account status
-        3. Ensuring market is open
-        4. Contacting support if the issue persists
-        """
+        return _UNEXPECTED_OPTION_ORDER_ERROR_TEMPLATE.format(error_message=str(e))
+
+# Matches: <number><unit> where unit can be Min, Hour, Day, Week, Month
+_TIMEFRAME_PATTERN = re.compile(r'^(\d+)(Min|Hour|Day|Week|Month)$', re.IGNORECASE)
+
+_PREDEFINED_TIMEFRAMES = {
+    "1Min": TimeFrame.Minute,
+    "1Hour": TimeFrame.Hour,
+    "1Day": TimeFrame.Day,
+    "1Week": TimeFrame.Week,
+    "1Month": TimeFrame.Month
+}
+
+# Map unit strings to TimeFrameUnit enums
+_TIMEFRAME_UNIT_MAPPING = {
+    'min': TimeFrameUnit.Minute,
+    'hour': TimeFrameUnit.Hour,
+    'day': TimeFrameUnit.Day,
+    'week': TimeFrameUnit.Week,
+    'month': TimeFrameUnit.Month
+}
 
 def parse_timeframe_with_enums(timeframe_str: str) -> Optional[TimeFrame]:
     """
@@ -1934,21 +1989,11 @@ def parse_timeframe_with_enums(timeframe_str: str) -> Optional[TimeFrame]:
         timeframe_str = timeframe_str.strip()
         
         # Use predefined TimeFrame objects for common cases (more efficient)
-        predefined_timeframes = {
-            "1Min": TimeFrame.Minute,
-            "1Hour": TimeFrame.Hour, 
-            "1Day": TimeFrame.Day,
-            "1Week": TimeFrame.Week,
-            "1Month": TimeFrame.Month
-        }
-        
-        if timeframe_str in predefined_timeframes:
-            return predefined_timeframes[timeframe_str]
+        if timeframe_str in _PREDEFINED_TIMEFRAMES:
+            return _PREDEFINED_TIMEFRAMES[timeframe_str]
         
         # Flexible regex pattern to parse any valid timeframe format
-        # Matches: <number><unit> where unit can be Min, Hour, Day, Week, Month
-        pattern = r'^(\d+)(Min|Hour|Day|Week|Month)$'
-        match = re.match(pattern, timeframe_str, re.IGNORECASE)
+        match = _TIMEFRAME_PATTERN.match(timeframe_str)
         
         if not match:
             return None
@@ -1956,16 +2001,7 @@ def parse_timeframe_with_enums(timeframe_str: str) -> Optional[TimeFrame]:
         amount = int(match.group(1))
         unit_str = match.group(2).lower()
         
-        # Map unit strings to TimeFrameUnit enums
-        unit_mapping = {
-            'min': TimeFrameUnit.Minute,
-            'hour': TimeFrameUnit.Hour,
-            'day': TimeFrameUnit.Day,
-            'week': TimeFrameUnit.Week,
-            'month': TimeFrameUnit.Month
-        }
-        
-        unit = unit_mapping.get(unit_str)
+        unit = _TIMEFRAME_UNIT_MAPPING.get(unit_str)
         if unit is None:
             return None
             